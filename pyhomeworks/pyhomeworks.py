@@ -13,7 +13,7 @@ from contextlib import suppress
 import logging
 import select
 import socket
-from threading import Thread
+from threading import Lock, Thread
 import time
 from typing import Any, Final
 
@@ -82,7 +82,7 @@ IGNORED = {
 }
 
 
-class Homeworks(Thread):
+class Homeworks(Thread):  # pylint: disable=too-many-instance-attributes
     """Interface with a Lutron Homeworks 4/8 Series system."""
 
     COMMAND_SEPARATOR_RX: Final = b"\r"
@@ -94,6 +94,11 @@ class Homeworks(Thread):
     POLLING_FREQ: Final = 1.0
     LOGIN_PROMPT_WAIT_TIME: Final = 0.2
     SOCKET_CONNECT_TIMEOUT: Final = 10.0
+    KEEPALIVE_IDLE: Final = 10
+    KEEPALIVE_INTERVAL: Final = 5
+    KEEPALIVE_COUNT: Final = 3
+    # Re-enabling dimmer monitoring is harmless and its reply is in IGNORED
+    HEARTBEAT_COMMAND: Final = "DLMON"
 
     def __init__(  # pylint: disable=too-many-arguments
         self,
@@ -102,17 +107,63 @@ class Homeworks(Thread):
         callback: Callable[[Any, Any], None],
         username: str | None = None,
         password: str | None = None,
+        *,
+        heartbeat_interval: float | None = None,
+        heartbeat_timeout: float = 5.0,
     ) -> None:
-        """Initialize."""
+        """Initialize.
+
+        If heartbeat_interval is set, a cheap command is sent to the controller
+        whenever nothing has been received for that many seconds. If no data
+        arrives within heartbeat_timeout seconds, the connection is considered
+        dead and is re-established. The deadline is checked every POLLING_FREQ
+        seconds, so a timeout may be noticed up to that much later.
+        """
+        if heartbeat_interval is not None and heartbeat_interval <= 0:
+            raise ValueError("heartbeat_interval must be positive")
+        if heartbeat_timeout <= 0:
+            raise ValueError("heartbeat_timeout must be positive")
         Thread.__init__(self)
         self._host = host
         self._port = int(port)
         self._credentials = _format_credentials(username, password)
         self._callback = callback
         self._socket: socket.socket | None = None
+        self._heartbeat_interval = heartbeat_interval
+        self._heartbeat_timeout = heartbeat_timeout
+        self._heartbeat_sent: float | None = None
+        self._last_received = 0.0
+        self._lock = Lock()
+        self._connections_closed = 0
+        self._half_open_detected = 0
+        self._detect_time_total = 0.0
+        self._detect_time_samples = 0
 
         self._running = False
 
+    @property
+    def metrics(self) -> dict[str, Any]:
+        """Return connection health metrics.
+
+        connections_closed counts connections cleanly closed by the controller.
+        half_open_detected counts dead links found by a heartbeat timeout or a
+        socket error on an established connection, such as a reset from a
+        rebooted NPort or a TCP keepalive timeout. mean_time_to_detect is the
+        mean time from the last data received until a dead link was detected.
+        It is only sampled while the heartbeat is enabled, since otherwise the
+        last data received may be arbitrarily old.
+        """
+        with self._lock:
+            return {
+                "connections_closed": self._connections_closed,
+                "half_open_detected": self._half_open_detected,
+                "mean_time_to_detect": (
+                    self._detect_time_total / self._detect_time_samples
+                    if self._detect_time_samples
+                    else None
+                ),
+            }
+
     def connect(self) -> None:
         """Connect to controller using host, port.
 
@@ -139,19 +190,33 @@ class Homeworks(Thread):
                 f"Couldn't connect to '{self._host}:{self._port}'"
             ) from error
 
+        _set_keepalive(
+            self._socket,
+            self.KEEPALIVE_IDLE,
+            self.KEEPALIVE_INTERVAL,
+            self.KEEPALIVE_COUNT,
+        )
+        self._last_received = time.monotonic()
+        self._heartbeat_sent = None
         _LOGGER.info("Connected to '%s:%s'", self._host, self._port)
 
         # Wait for login prompt
         time.sleep(self.LOGIN_PROMPT_WAIT_TIME)
-        buffer = self._read()
-        while buffer.startswith(self.LINE_ENDING_CHARACTERS):
-            buffer = buffer[1:]
-        if buffer.startswith(self.LOGIN_REQUEST):
-            try:
-                self._handle_login_request(callback_on_login_error)
-            except exceptions.HomeworksException:
-                self._close()
-                raise
+        try:
+            buffer = self._read()
+            while buffer.startswith(self.LINE_ENDING_CHARACTERS):
+                buffer = buffer[1:]
+            if buffer.startswith(self.LOGIN_REQUEST):
+                try:
+                    self._handle_login_request(callback_on_login_error)
+                except exceptions.HomeworksException:
+                    self._close()
+                    raise
+        except OSError as error:
+            self._close()
+            raise exceptions.HomeworksConnectionFailed(
+                f"Connection to '{self._host}:{self._port}' failed during login"
+            ) from error
 
         # Setup interface and subscribe to events
         self._subscribe()
@@ -177,20 +242,38 @@ class Homeworks(Thread):
             return b""
         recv = self._socket.recv(1024)  # type: ignore[union-attr]
         if not recv:
-            self._close()
+            self._connection_lost(False)
             raise exceptions.HomeworksConnectionLost
         _LOGGER.debug("recv: %s", recv)
+        self._last_received = time.monotonic()
+        self._heartbeat_sent = None
         return recv
 
     def _send(self, command: str) -> bool:
         _LOGGER.debug("send: %s", command)
         try:
             self._socket.send(command.encode("utf8") + self.COMMAND_SEPARATOR_TX)  # type: ignore[union-attr]
-        except (ConnectionError, AttributeError):
-            self._close()
+        except AttributeError:
+            return False
+        except OSError:
+            self._connection_lost(True)
             return False
         return True
 
+    def _check_heartbeat(self) -> None:
+        """Send a heartbeat when idle and check that the link is alive."""
+        if self._heartbeat_interval is None:
+            return
+        now = time.monotonic()
+        if self._heartbeat_sent is not None:
+            if now - self._heartbeat_sent > self._heartbeat_timeout:
+                _LOGGER.debug("Heartbeat timed out")
+                self._connection_lost(True)
+                raise exceptions.HomeworksConnectionLost
+        elif now - self._last_received >= self._heartbeat_interval:
+            self._heartbeat_sent = now
+            self._send(self.HEARTBEAT_COMMAND)
+
     def fade_dim(
         self, intensity: float, fade_time: float, delay_time: float, addr: str
     ) -> None:
@@ -231,13 +314,17 @@ class Homeworks(Thread):
                         if not command:
                             continue
                         self._process_received_data(command)
+                    self._check_heartbeat()
                 except (
-                    ConnectionError,
+                    OSError,
                     AttributeError,
                     exceptions.HomeworksConnectionLost,
-                ):
+                ) as error:
                     _LOGGER.warning("Lost connection.")
-                    self._close()
+                    if isinstance(error, OSError):
+                        self._connection_lost(True)
+                    else:
+                        self._close()
                     buffer = b""
                     if self._running:
                         time.sleep(self.POLLING_FREQ)
@@ -273,6 +360,20 @@ class Homeworks(Thread):
             )
         self._close()
 
+    def _connection_lost(self, half_open: bool) -> None:
+        """Record a lost connection and close it."""
+        with self._lock:
+            if self._socket is None:
+                return
+            if not half_open:
+                self._connections_closed += 1
+            else:
+                self._half_open_detected += 1
+                if self._heartbeat_interval is not None:
+                    self._detect_time_total += time.monotonic() - self._last_received
+                    self._detect_time_samples += 1
+            self._close()
+
     def _close(self) -> None:
         """Close the connection to the controller."""
         if self._socket:
@@ -293,6 +394,28 @@ class Homeworks(Thread):
         self._send("KLMON")  # Monitor keypad LED states
 
 
+def _set_keepalive(sock: socket.socket, idle: int, interval: int, count: int) -> None:
+    """Enable TCP keepalive so a half-open connection is detected quickly."""
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    # Not all platforms expose the tuning options
+    if hasattr(socket, "TCP_KEEPIDLE"):
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, idle)
+    elif hasattr(socket, "TCP_KEEPALIVE"):
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPALIVE, idle)
+    if hasattr(socket, "TCP_KEEPINTVL"):
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, interval)
+    if hasattr(socket, "TCP_KEEPCNT"):
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, count)
+    # Keepalive only probes an idle connection, so also bound how long sent
+    # data may stay unacknowledged before the connection is dropped
+    if hasattr(socket, "TCP_USER_TIMEOUT"):
+        sock.setsockopt(
+            socket.IPPROTO_TCP,
+            socket.TCP_USER_TIMEOUT,
+            (idle + interval * count) * 1000,
+        )
+
+
 def _format_credentials(username: str | None, password: str | None) -> str | None:
     """Return a credential string from username and password."""
     if password is not None and username is None:
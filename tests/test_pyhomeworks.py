@@ -0,0 +1,193 @@
+"""Tests for connection health detection."""
+
+# pylint: disable=protected-access
+
+from collections.abc import Iterator
+import socket
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from pyhomeworks import exceptions
+from pyhomeworks.pyhomeworks import Homeworks, _set_keepalive
+
+
+def _homeworks(**kwargs: float) -> Homeworks:
+    return Homeworks("127.0.0.1", 4008, MagicMock(), **kwargs)
+
+
+@pytest.fixture(name="peer")
+def peer_fixture() -> Iterator[tuple[Homeworks, socket.socket]]:
+    """Return a Homeworks connected to one end of a socket pair."""
+    hw_socket, peer_socket = socket.socketpair()
+    peer_socket.settimeout(1)
+    hw = _homeworks(heartbeat_interval=10, heartbeat_timeout=5)
+    hw._socket = hw_socket
+    hw._last_received = time.monotonic()
+    yield hw, peer_socket
+    hw._close()
+    peer_socket.close()
+
+
+def test_heartbeat_not_sent_when_recently_received(peer) -> None:
+    hw, _ = peer
+    hw._check_heartbeat()
+    assert hw._heartbeat_sent is None
+
+
+def test_heartbeat_sent_when_idle(peer) -> None:
+    hw, peer_socket = peer
+    hw._last_received = time.monotonic() - 11
+    hw._check_heartbeat()
+    assert hw._heartbeat_sent is not None
+    assert peer_socket.recv(1024) == b"DLMON\r\n"
+
+
+def test_heartbeat_not_resent_while_waiting(peer) -> None:
+    hw, peer_socket = peer
+    hw._last_received = time.monotonic() - 11
+    hw._check_heartbeat()
+    sent = hw._heartbeat_sent
+    hw._check_heartbeat()
+    assert hw._heartbeat_sent == sent
+    peer_socket.setblocking(False)
+    assert peer_socket.recv(1024) == b"DLMON\r\n"
+    with pytest.raises(BlockingIOError):
+        peer_socket.recv(1024)
+
+
+def test_any_received_data_is_proof_of_life(peer) -> None:
+    hw, peer_socket = peer
+    hw._last_received = time.monotonic() - 11
+    hw._check_heartbeat()
+    peer_socket.send(b"DL, [01:01:00:01], 50\r")
+    assert hw._read()
+    assert hw._heartbeat_sent is None
+    assert time.monotonic() - hw._last_received < 1
+
+
+def test_heartbeat_timeout(peer) -> None:
+    hw, _ = peer
+    hw._last_received = time.monotonic() - 16
+    hw._heartbeat_sent = time.monotonic() - 6
+    with pytest.raises(exceptions.HomeworksConnectionLost):
+        hw._check_heartbeat()
+    assert hw._socket is None
+    metrics = hw.metrics
+    assert metrics["half_open_detected"] == 1
+    assert metrics["connections_closed"] == 0
+    assert metrics["mean_time_to_detect"] == pytest.approx(16, abs=1)
+
+
+def test_heartbeat_reply_is_ignored(peer) -> None:
+    hw, _ = peer
+    hw._process_received_data(b"Dimmer level monitoring enabled")
+    hw._callback.assert_not_called()
+
+
+def test_clean_close_counted_separately(peer) -> None:
+    hw, peer_socket = peer
+    peer_socket.close()
+    with pytest.raises(exceptions.HomeworksConnectionLost):
+        hw._read()
+    assert hw._socket is None
+    assert hw.metrics == {
+        "connections_closed": 1,
+        "half_open_detected": 0,
+        "mean_time_to_detect": None,
+    }
+
+
+def test_connection_lost_counted_once(peer) -> None:
+    hw, _ = peer
+    hw._connection_lost(True)
+    hw._connection_lost(True)
+    assert hw.metrics["half_open_detected"] == 1
+
+
+def test_send_timeout_error() -> None:
+    hw = _homeworks()
+    hw._socket = MagicMock()
+    hw._socket.send.side_effect = TimeoutError(110, "Connection timed out")
+    assert not hw._send("KBMON")
+    assert hw._socket is None
+    # The heartbeat is disabled, so the detection is not timed
+    assert hw.metrics == {
+        "connections_closed": 0,
+        "half_open_detected": 1,
+        "mean_time_to_detect": None,
+    }
+
+
+@pytest.mark.parametrize("error", [ConnectionResetError, BrokenPipeError])
+def test_send_connection_reset(error: type[OSError]) -> None:
+    hw = _homeworks()
+    hw._socket = MagicMock()
+    hw._socket.send.side_effect = error
+    assert not hw._send("KBMON")
+    assert hw.metrics["connections_closed"] == 0
+    assert hw.metrics["half_open_detected"] == 1
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        ConnectionResetError(104, "Connection reset by peer"),
+        TimeoutError(110, "Connection timed out"),
+        OSError(113, "No route to host"),
+    ],
+)
+def test_run_survives_socket_errors(peer, error: OSError) -> None:
+    hw, _ = peer
+
+    def _read() -> bytes:
+        hw._running = False
+        raise error
+
+    hw._read = _read  # type: ignore[method-assign]
+    hw.run()
+    assert hw._socket is None
+    assert hw.metrics["half_open_detected"] == 1
+
+
+def test_keepalive_enabled() -> None:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        _set_keepalive(sock, 10, 5, 3)
+        assert sock.getsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE)
+        if hasattr(socket, "TCP_KEEPIDLE"):
+            assert sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE) == 10
+        if hasattr(socket, "TCP_KEEPINTVL"):
+            assert sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL) == 5
+        if hasattr(socket, "TCP_KEEPCNT"):
+            assert sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT) == 3
+        if hasattr(socket, "TCP_USER_TIMEOUT"):
+            assert (
+                sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_USER_TIMEOUT) == 25000
+            )
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"heartbeat_interval": 0},
+        {"heartbeat_interval": -1},
+        {"heartbeat_timeout": 0},
+    ],
+)
+def test_invalid_heartbeat_arguments(kwargs: dict[str, float]) -> None:
+    with pytest.raises(ValueError):
+        _homeworks(**kwargs)
+
+
+def test_connect_reset_during_login(monkeypatch: pytest.MonkeyPatch) -> None:
+    sock = MagicMock()
+    sock.recv.side_effect = ConnectionResetError(104, "Connection reset by peer")
+    monkeypatch.setattr(socket, "create_connection", lambda *args: sock)
+    monkeypatch.setattr("select.select", lambda r, w, x, t: (r, w, x))
+    hw = _homeworks()
+    monkeypatch.setattr(hw, "LOGIN_PROMPT_WAIT_TIME", 0)
+    with pytest.raises(exceptions.HomeworksConnectionFailed):
+        hw.connect()
+    assert hw._socket is None
+    sock.close.assert_called_once()